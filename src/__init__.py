@@ -8,7 +8,8 @@ recommendations for the current bankroll and conditions.
 
 from .poker_bankroll import PokerBankrollAnalyzer, quick_analysis
 from .io_ops import load_raw_session_data, create_sample_session_data
-from .enrich import enrich_session_data
+from .enrich import enrich_session_data, enrich_session_data_polars
+from .sessions import Sessions
 from .estimate import estimate_mu_sigma_by_stake
 from .simulate import run_stake_simulations
 from .recommend import generate_stake_recommendations
@@ -22,6 +23,8 @@ __all__ = [
     "load_raw_session_data",
     "create_sample_session_data",
     "enrich_session_data",
+    "enrich_session_data_polars",
+    "Sessions",
     "estimate_mu_sigma_by_stake",
     "run_stake_simulations",
     "generate_stake_recommendations",
@@ -5,7 +5,77 @@ Derive features that matter for variance: straddle exposure, stack depth buckets
 
 import pandas as pd
 import numpy as np
-from typing import Dict
+from typing import TYPE_CHECKING, Dict, Union
+
+if TYPE_CHECKING:
+    import polars as pl
+
+try:
+    import pyarrow  # noqa: F401
+
+    HAS_PYARROW = True
+except ImportError:  # Optional dependency; Arrow features are skipped
+    HAS_PYARROW = False
+
+# Arrow-backed strings: contiguous UTF-8 buffers and Arrow string kernels
+STRING_DTYPE = "string[pyarrow]" if HAS_PYARROW else "object"
+
+# Fixed category orders; multiplier arrays are indexed by categorical code,
+# with a trailing NaN so unknown levels (code -1) map to NaN
+STRADDLE_LEVELS = ["none", "low", "medium", "high", "mandatory"]
+_STRADDLE_MULTIPLIERS = np.array(
+    [
+        1.0,
+        1.1,  # Occasional straddle, small impact
+        1.25,  # Regular straddling, moderate impact
+        1.5,  # Frequent straddling, high impact
+        2.0,  # Always straddled, double impact
+        np.nan,
+    ]
+)
+
+# S <=120bb, N 120-200bb, D 200-320bb, VD >320bb
+STACK_DEPTH_LEVELS = ["S", "N", "D", "VD"]
+_DEPTH_VARIANCE_MULTS = np.array([0.7, 1.0, 1.4, 2.0, np.nan])
+_DEPTH_SKILL_MULTS = np.array([1.1, 1.0, 1.15, 1.3, np.nan])
+
+# Derived ratios stored as float32 once enrichment is done; dollar amounts
+# (buyins, cashouts, net_result) stay float64 to keep cents exact
+FLOAT32_COLUMNS = [
+    "effective_bb",
+    "straddle_multiplier",
+    "effective_bb_with_straddle",
+    "bombpot_intensity",
+    "standup_intensity",
+    "bounty_intensity",
+    "side_game_intensity",
+    "depth_variance_mult",
+    "depth_skill_mult",
+    "roi",
+    "hourly_rate",
+    "bb_per_hour",
+    "bb_per_session",
+    "buyins_risked",
+    "bb_per_buyin_risked",
+    "hands_per_hour",
+    "bb_per_hand",
+    "usd_per_hand",
+]
+
+
+def _level_codes(values: pd.Series, levels: list) -> np.ndarray:
+    """
+    Codes of values against a fixed level order, -1 for unknown levels.
+
+    Columns already categorized at load time keep the fixed levels first,
+    so their codes are reused directly instead of re-hashing the strings.
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype) and list(
+        values.cat.categories[: len(levels)]
+    ) == list(levels):
+        codes = values.cat.codes.to_numpy()
+        return np.where(codes < len(levels), codes, -1)
+    return pd.Categorical(values, categories=levels).codes
 
 
 def derive_effective_bb(df: pd.DataFrame) -> pd.DataFrame:
@@ -24,16 +94,34 @@ def derive_effective_bb(df: pd.DataFrame) -> pd.DataFrame:
         DataFrame with added effective_bb column
     """
     df = df.copy()
+    _add_effective_bb(df)
+    return df
 
-    def extract_bb(stake_text: str) -> float:
-        """Extract big blind from stake text."""
-        parts = stake_text.split("-")
-        if len(parts) >= 2:
-            return float(parts[1])
-        return 1.0  # fallback
 
-    df["effective_bb"] = df["stake_text"].apply(extract_bb)
-    return df
+def _add_effective_bb(df: pd.DataFrame) -> None:
+    """Add effective_bb column to df in place."""
+    stakes = df["stake_text"]
+    if isinstance(stakes.dtype, pd.CategoricalDtype):
+        # Parse each distinct stake once, then gather by code
+        level_bb = np.append(_parse_big_blind(stakes.cat.categories), 1.0)
+        df["effective_bb"] = level_bb[stakes.cat.codes.to_numpy()]
+    else:
+        df["effective_bb"] = _parse_big_blind(stakes)
+
+
+def _parse_big_blind(stakes) -> np.ndarray:
+    """Big blind of each stake string as float64."""
+    # Second dash-separated field is the big blind; 1.0 fallback if missing
+    parts = (
+        pd.Series(stakes)
+        .astype(STRING_DTYPE)
+        .str.split("-", n=2, expand=False)
+    )
+    return (
+        pd.to_numeric(parts.str[1], errors="coerce")
+        .fillna(1.0)
+        .to_numpy(dtype="float64")
+    )
 
 
 def tag_straddle_impact(df: pd.DataFrame) -> pd.DataFrame:
@@ -49,24 +137,18 @@ def tag_straddle_impact(df: pd.DataFrame) -> pd.DataFrame:
         DataFrame with added straddle_multiplier and effective_bb_with_straddle columns
     """
     df = df.copy()
+    _add_straddle_impact(df)
+    return df
 
-    straddle_multipliers = {
-        "none": 1.0,
-        "low": 1.1,  # Occasional straddle, small impact
-        "medium": 1.25,  # Regular straddling, moderate impact
-        "high": 1.5,  # Frequent straddling, high impact
-        "mandatory": 2.0,  # Always straddled, double impact
-    }
 
-    df["straddle_multiplier"] = df["straddle_exposure"].map(
-        straddle_multipliers
-    )
+def _add_straddle_impact(df: pd.DataFrame) -> None:
+    """Add straddle columns to df in place."""
+    codes = _level_codes(df["straddle_exposure"], STRADDLE_LEVELS)
+    df["straddle_multiplier"] = _STRADDLE_MULTIPLIERS[codes]
     df["effective_bb_with_straddle"] = (
         df["effective_bb"] * df["straddle_multiplier"]
     )
 
-    return df
-
 
 def tag_side_games(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -82,7 +164,12 @@ def tag_side_games(df: pd.DataFrame) -> pd.DataFrame:
         DataFrame with added side game intensity columns
     """
     df = df.copy()
+    _add_side_games(df)
+    return df
 
+
+def _add_side_games(df: pd.DataFrame) -> None:
+    """Add side game intensity columns to df in place."""
     # Normalize side game exposure (0-1 scale)
     df["bombpot_intensity"] = (
         df["side_bombpots_count"] / df["hours_played"]
@@ -99,8 +186,6 @@ def tag_side_games(df: pd.DataFrame) -> pd.DataFrame:
         + df["bounty_intensity"]
     )
 
-    return df
-
 
 def bucket_stack_depth_effect(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -119,22 +204,15 @@ def bucket_stack_depth_effect(df: pd.DataFrame) -> pd.DataFrame:
         DataFrame with added depth effect columns
     """
     df = df.copy()
+    _add_stack_depth_effect(df)
+    return df
 
-    depth_effects = {
-        "S": {"variance_mult": 0.7, "skill_mult": 1.1},  # S <=120bb
-        "N": {"variance_mult": 1.0, "skill_mult": 1.0},  # N 120-200bb
-        "D": {"variance_mult": 1.4, "skill_mult": 1.15},  # D 200-320bb
-        "VD": {"variance_mult": 2.0, "skill_mult": 1.3},  # VD >320bb
-    }
-
-    df["depth_variance_mult"] = df["stack_depth_class"].map(
-        lambda x: depth_effects[x]["variance_mult"]
-    )
-    df["depth_skill_mult"] = df["stack_depth_class"].map(
-        lambda x: depth_effects[x]["skill_mult"]
-    )
 
-    return df
+def _add_stack_depth_effect(df: pd.DataFrame) -> None:
+    """Add depth effect columns to df in place."""
+    codes = _level_codes(df["stack_depth_class"], STACK_DEPTH_LEVELS)
+    df["depth_variance_mult"] = _DEPTH_VARIANCE_MULTS[codes]
+    df["depth_skill_mult"] = _DEPTH_SKILL_MULTS[codes]
 
 
 def calculate_session_metrics(df: pd.DataFrame) -> pd.DataFrame:
@@ -148,25 +226,38 @@ def calculate_session_metrics(df: pd.DataFrame) -> pd.DataFrame:
         DataFrame with added performance metrics
     """
     df = df.copy()
+    _add_session_metrics(df)
+    return df
 
-    # Basic results
-    df["net_result"] = df["cashouts_usd"] - df["buyins_usd"]
-    df["roi"] = df["net_result"] / df["buyins_usd"]  # Return on investment
 
-    # Hourly rates
-    df["hourly_rate"] = df["net_result"] / df["hours_played"]
+def _add_session_metrics(df: pd.DataFrame) -> None:
+    """Add performance metric columns to df in place."""
+    # Columns share df's index, so plain numpy skips alignment per op
+    cashouts = df["cashouts_usd"].to_numpy(dtype=np.float64)
+    buyins = df["buyins_usd"].to_numpy(dtype=np.float64)
+    hours = df["hours_played"].to_numpy(dtype=np.float64)
+    bb = df["effective_bb_with_straddle"].to_numpy(dtype=np.float64)
 
-    # Big blind rates (key poker metric)
-    df["bb_per_hour"] = df["hourly_rate"] / df["effective_bb_with_straddle"]
-    df["bb_per_session"] = df["net_result"] / df["effective_bb_with_straddle"]
+    # Zero divisors give inf/nan, as with Series arithmetic
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Basic results
+        net = cashouts - buyins
+        df["net_result"] = net
+        df["roi"] = net / buyins  # Return on investment
 
-    # Risk-adjusted metrics
-    df["buyins_risked"] = df["buyins_usd"] / (
-        100 * df["effective_bb_with_straddle"]
-    )
-    df["bb_per_buyin_risked"] = df["bb_per_session"] / df["buyins_risked"]
+        # Hourly rates
+        hourly = net / hours
+        df["hourly_rate"] = hourly
 
-    return df
+        # Big blind rates (key poker metric)
+        df["bb_per_hour"] = hourly / bb
+        bb_per_session = net / bb
+        df["bb_per_session"] = bb_per_session
+
+        # Risk-adjusted metrics
+        risked = buyins / (100 * bb)
+        df["buyins_risked"] = risked
+        df["bb_per_buyin_risked"] = bb_per_session / risked
 
 
 def estimate_hands_per_hour() -> Dict[str, float]:
@@ -197,34 +288,41 @@ def calculate_hands_played(df: pd.DataFrame) -> pd.DataFrame:
         DataFrame with added hands played metrics
     """
     df = df.copy()
+    _add_hands_played(df)
+    return df
 
+
+def _add_hands_played(df: pd.DataFrame) -> None:
+    """Add hands played columns to df in place."""
     hands_config = estimate_hands_per_hour()
     base_rate = hands_config["live_poker_base"]
+    straddle_step = hands_config["straddle_adjustment"]
+    deep_step = hands_config["deep_stack_adjustment"]
+    side_step = hands_config["side_game_adjustment"]
 
     # Adjust for game conditions
-    straddle_adj = df["straddle_multiplier"].apply(
-        lambda x: hands_config["straddle_adjustment"] if x > 1.1 else 0
+    straddle_adj = np.where(
+        df["straddle_multiplier"].to_numpy() > 1.1, straddle_step, 0
     )
-    depth_adj = df["stack_depth_class"].apply(
-        lambda x: (
-            hands_config["deep_stack_adjustment"] if x in ["D", "VD"] else 0
-        )
+    depth_codes = _level_codes(df["stack_depth_class"], STACK_DEPTH_LEVELS)
+    # D and VD are the last two levels; unknown (-1) stays unadjusted
+    depth_adj = np.where(
+        depth_codes >= STACK_DEPTH_LEVELS.index("D"), deep_step, 0
     )
-    side_adj = df["side_game_intensity"].apply(
-        lambda x: hands_config["side_game_adjustment"] * min(x, 1)
+    side_adj = side_step * np.minimum(
+        df["side_game_intensity"].to_numpy(), 1.0
     )
 
-    df["hands_per_hour"] = base_rate + straddle_adj + depth_adj + side_adj
-    df["hands_played"] = (
-        (df["hands_per_hour"] * df["hours_played"]).round().astype(int)
-    )
+    hands_per_hour = base_rate + straddle_adj + depth_adj + side_adj
+    df["hands_per_hour"] = hands_per_hour
+    df["hands_played"] = np.rint(
+        hands_per_hour * df["hours_played"].to_numpy()
+    ).astype(np.int32)
 
     # Calculate per-hand metrics
     df["bb_per_hand"] = df["bb_per_session"] / df["hands_played"]
     df["usd_per_hand"] = df["net_result"] / df["hands_played"]
 
-    return df
-
 
 def enrich_session_data(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -236,11 +334,164 @@ def enrich_session_data(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         Fully enriched DataFrame with all derived features
     """
+    out = df.copy()
+
+    # Single copy up front; each stage then adds its columns in place
+    _add_effective_bb(out)
+    _add_straddle_impact(out)
+    _add_side_games(out)
+    _add_stack_depth_effect(out)
+    _add_session_metrics(out)
+    _add_hands_played(out)
+
+    # Stages compute in float64; only the stored ratios are narrowed
+    return out.astype(dict.fromkeys(FLOAT32_COLUMNS, np.float32))
+
+
+def enrich_session_data_polars(
+    df: Union[pd.DataFrame, "pl.DataFrame"],
+) -> "pl.DataFrame":
+    """
+    Polars version of enrich_session_data.
+
+    Builds every derived column as one lazy query so Polars can plan and
+    run the whole enrichment multithreaded. Requires the optional polars
+    dependency.
+
+    Args:
+        df: Raw session DataFrame (pandas or Polars)
+
+    Returns:
+        Fully enriched Polars DataFrame with the same columns as
+        enrich_session_data
+    """
+    import polars as pl
+
+    if isinstance(df, pd.DataFrame):
+        df = pl.from_pandas(df)
+
+    hands_config = estimate_hands_per_hour()
+    straddle_map = dict(zip(STRADDLE_LEVELS, _STRADDLE_MULTIPLIERS[:-1]))
+    variance_map = dict(zip(STACK_DEPTH_LEVELS, _DEPTH_VARIANCE_MULTS[:-1]))
+    skill_map = dict(zip(STACK_DEPTH_LEVELS, _DEPTH_SKILL_MULTS[:-1]))
+
+    hours = pl.col("hours_played")
+    bb = pl.col("effective_bb_with_straddle")
+    net = pl.col("net_result")
+
+    # Categorical columns are cast to String where string semantics matter
+    lf = (
+        df.lazy()
+        .with_columns(
+            pl.col("stake_text")
+            .cast(pl.String)
+            .str.split("-")
+            .list.get(1, null_on_oob=True)
+            .cast(pl.Float64, strict=False)
+            .fill_null(1.0)
+            .alias("effective_bb"),
+            pl.col("straddle_exposure")
+            .cast(pl.String)
+            .replace_strict(
+                straddle_map, default=None, return_dtype=pl.Float64
+            )
+            .alias("straddle_multiplier"),
+            ((pl.col("side_bombpots_count") / hours).clip(0, 5) / 5).alias(
+                "bombpot_intensity"
+            ),
+            (
+                (pl.col("side_standup_minutes") / (hours * 60)).clip(0, 0.5)
+                / 0.5
+            ).alias("standup_intensity"),
+            pl.col("side_bounty_flag")
+            .cast(pl.Float64)
+            .alias("bounty_intensity"),
+        )
+        .with_columns(
+            (pl.col("effective_bb") * pl.col("straddle_multiplier")).alias(
+                "effective_bb_with_straddle"
+            ),
+            (
+                pl.col("bombpot_intensity")
+                + pl.col("standup_intensity")
+                + pl.col("bounty_intensity")
+            ).alias("side_game_intensity"),
+            pl.col("stack_depth_class")
+            .cast(pl.String)
+            .replace_strict(
+                variance_map, default=None, return_dtype=pl.Float64
+            )
+            .alias("depth_variance_mult"),
+            pl.col("stack_depth_class")
+            .cast(pl.String)
+            .replace_strict(skill_map, default=None, return_dtype=pl.Float64)
+            .alias("depth_skill_mult"),
+            (pl.col("cashouts_usd") - pl.col("buyins_usd")).alias(
+                "net_result"
+            ),
+        )
+        .with_columns(
+            (net / pl.col("buyins_usd")).alias("roi"),
+            (net / hours).alias("hourly_rate"),
+            (net / hours / bb).alias("bb_per_hour"),
+            (net / bb).alias("bb_per_session"),
+            (pl.col("buyins_usd") / (100 * bb)).alias("buyins_risked"),
+            (
+                pl.lit(hands_config["live_poker_base"])
+                + pl.when(pl.col("straddle_multiplier") > 1.1)
+                .then(hands_config["straddle_adjustment"])
+                .otherwise(0)
+                + pl.when(pl.col("stack_depth_class").is_in(["D", "VD"]))
+                .then(hands_config["deep_stack_adjustment"])
+                .otherwise(0)
+                + hands_config["side_game_adjustment"]
+                * pl.col("side_game_intensity").clip(upper_bound=1.0)
+            ).alias("hands_per_hour"),
+        )
+        .with_columns(
+            (pl.col("bb_per_session") / pl.col("buyins_risked")).alias(
+                "bb_per_buyin_risked"
+            ),
+            (pl.col("hands_per_hour") * hours)
+            .round(0, mode="half_to_even")
+            .cast(pl.Int32)
+            .alias("hands_played"),
+        )
+        .with_columns(
+            (pl.col("bb_per_session") / pl.col("hands_played")).alias(
+                "bb_per_hand"
+            ),
+            (net / pl.col("hands_played")).alias("usd_per_hand"),
+        )
+    )
+
+    # Match the column order produced by enrich_session_data
+    derived = [
+        "effective_bb",
+        "straddle_multiplier",
+        "effective_bb_with_straddle",
+        "bombpot_intensity",
+        "standup_intensity",
+        "bounty_intensity",
+        "side_game_intensity",
+        "depth_variance_mult",
+        "depth_skill_mult",
+        "net_result",
+        "roi",
+        "hourly_rate",
+        "bb_per_hour",
+        "bb_per_session",
+        "buyins_risked",
+        "bb_per_buyin_risked",
+        "hands_per_hour",
+        "hands_played",
+        "bb_per_hand",
+        "usd_per_hand",
+    ]
+    raw_columns = [c for c in df.columns if c not in derived]
+
     return (
-        df.pipe(derive_effective_bb)
-        .pipe(tag_straddle_impact)
-        .pipe(tag_side_games)
-        .pipe(bucket_stack_depth_effect)
-        .pipe(calculate_session_metrics)
-        .pipe(calculate_hands_played)
+        lf.select(raw_columns + derived)
+        .with_columns(pl.col(FLOAT32_COLUMNS).cast(pl.Float32))
+        .collect(engine="streaming")
     )
@@ -6,87 +6,193 @@ Estimate per hand win rate mu and variance sigma^2 by stake and conditions.
 import pandas as pd
 import numpy as np
 from scipy import stats
-from typing import Dict, Tuple
+from typing import Dict, Tuple, Union
+
+from .sessions import Sessions
+
+try:
+    from numba import njit, prange
+
+    HAS_NUMBA = True
+except ImportError:  # Optional dependency; numpy fallbacks are used instead
+    HAS_NUMBA = False
+
+try:
+    import numexpr as ne
+
+    HAS_NUMEXPR = True
+except ImportError:  # Optional dependency; numpy fallbacks are used instead
+    HAS_NUMEXPR = False
+
+# Bootstrap resamples drawn per vectorized block
+_BOOTSTRAP_BLOCK = 128
+
+
+if HAS_NUMBA:
+
+    @njit(parallel=True, cache=True)
+    def _resample_means_numba(data: np.ndarray, idx: np.ndarray) -> np.ndarray:
+        """Mean of data[idx[b]] for each row b, parallel over rows."""
+        n_rows, n = idx.shape
+        means = np.empty(n_rows)
+        for b in prange(n_rows):
+            total = 0.0
+            for j in range(n):
+                total += data[idx[b, j]]
+            means[b] = total / n
+        return means
+
+
+def _resample_means(data: np.ndarray, idx: np.ndarray) -> np.ndarray:
+    """Mean of each bootstrap resample given a (n_rows, n) index block."""
+    if HAS_NUMBA:
+        return _resample_means_numba(data, idx)
+    return data[idx].mean(axis=1)
+
+
+def _group_sum(codes: np.ndarray, x: np.ndarray, k: int) -> np.ndarray:
+    """Per-group sum of x over codes 0..k-1, skipping NaN."""
+    x = np.asarray(x, dtype=np.float64)
+    return np.bincount(codes, np.where(np.isnan(x), 0.0, x), minlength=k)
+
+
+def _group_moments(
+    codes: np.ndarray, x: np.ndarray, k: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-group mean and sample variance (ddof=1) of x, skipping NaN."""
+    x = np.asarray(x, dtype=np.float64)
+    valid = ~np.isnan(x)
+    codes, x = codes[valid], x[valid]
+
+    count = np.bincount(codes, minlength=k)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = np.bincount(codes, x, minlength=k) / count
+        # Two-pass variance avoids cancellation in sum(x^2) - n*mean^2
+        dev = x - mean[codes]
+        var = np.bincount(codes, dev * dev, minlength=k) / (count - 1)
+    var[count < 2] = np.nan
+    return mean, var
+
+
+def _aggregate_sessions(sessions: Sessions) -> pd.DataFrame:
+    """Per-stake reductions from a Sessions container via bincount."""
+    k = len(sessions.stake_levels)
+    has_stake = sessions.stake_code >= 0
+    codes = sessions.stake_code[has_stake]
+
+    def column(x: np.ndarray) -> np.ndarray:
+        return np.asarray(x)[has_stake]
+
+    mu_bb, var_bb = _group_moments(codes, column(sessions.bb_per_hand), k)
+    mu_usd, var_usd = _group_moments(codes, column(sessions.usd_per_hand), k)
+    mean_hours, _ = _group_moments(codes, column(sessions.hours_played), k)
+    mean_hph, _ = _group_moments(codes, column(sessions.hands_per_hour), k)
+
+    return pd.DataFrame(
+        {
+            "n_sessions": np.bincount(codes, minlength=k),
+            "total_hands": _group_sum(
+                codes, column(sessions.hands_played), k
+            ).astype(np.int64),
+            "total_hours": _group_sum(codes, column(sessions.hours_played), k),
+            "avg_session_hours": mean_hours,
+            "mu_bb_per_hand": mu_bb,
+            "std_bb": np.sqrt(var_bb),
+            "sigma2_bb_per_hand": var_bb,
+            "mu_usd_per_hand": mu_usd,
+            "std_usd": np.sqrt(var_usd),
+            "sigma2_usd_per_hand": var_usd,
+            "mean_hph": mean_hph,
+            "total_bb_won": _group_sum(
+                codes, column(sessions.bb_per_session), k
+            ),
+            "total_usd_won": _group_sum(codes, column(sessions.net_result), k),
+        },
+        index=pd.Index(sessions.stake_levels, name="stake_text"),
+    )
 
 
-def estimate_mu_sigma_by_stake(df: pd.DataFrame) -> pd.DataFrame:
+def estimate_mu_sigma_by_stake(
+    df: Union[pd.DataFrame, Sessions],
+) -> pd.DataFrame:
     """
     Estimate win rate (mu) and variance (sigma^2) per hand by stake level.
 
     Returns estimates with confidence intervals and sample sizes.
 
     Args:
-        df: DataFrame with enriched session data
+        df: DataFrame with enriched session data, or the same data as a
+            Sessions container (reduced with bincount, no pandas groupby)
 
     Returns:
         DataFrame with parameter estimates by stake
     """
-    estimates = []
-
-    for stake in df["stake_text"].unique():
-        stake_data = df[df["stake_text"] == stake].copy()
-
-        if len(stake_data) < 3:  # Minimum sample size
-            continue
-
-        # Basic statistics
-        n_sessions = len(stake_data)
-        total_hands = stake_data["hands_played"].sum()
-
-        # Per-hand win rate (mu)
-        mu_bb_per_hand = stake_data["bb_per_hand"].mean()
-        mu_usd_per_hand = stake_data["usd_per_hand"].mean()
-
-        # Per-hand variance (sigma^2)
-        session_bb_variance = stake_data["bb_per_hand"].var()
-        session_usd_variance = stake_data["usd_per_hand"].var()
-
-        # Confidence intervals
-        confidence_level = 0.95
-        t_critical = stats.t.ppf((1 + confidence_level) / 2, df=n_sessions - 1)
-
-        mu_bb_se = stake_data["bb_per_hand"].std() / np.sqrt(n_sessions)
-        mu_bb_ci_lower = mu_bb_per_hand - t_critical * mu_bb_se
-        mu_bb_ci_upper = mu_bb_per_hand + t_critical * mu_bb_se
-
-        mu_usd_se = stake_data["usd_per_hand"].std() / np.sqrt(n_sessions)
-        mu_usd_ci_lower = mu_usd_per_hand - t_critical * mu_usd_se
-        mu_usd_ci_upper = mu_usd_per_hand + t_critical * mu_usd_se
-
-        # Aggregate session data
-        total_bb_won = stake_data["bb_per_session"].sum()
-        total_usd_won = stake_data["net_result"].sum()
-        avg_hours = stake_data["hours_played"].mean()
-
-        estimates.append(
+    if isinstance(df, Sessions):
+        agg = _aggregate_sessions(df)
+    else:
+        # One hash partition by stake, all reductions in a single pass
+        agg = df.groupby("stake_text", sort=False, observed=True).agg(
+            n_sessions=("hands_played", "size"),
+            total_hands=("hands_played", "sum"),
+            total_hours=("hours_played", "sum"),
+            avg_session_hours=("hours_played", "mean"),
+            mu_bb_per_hand=("bb_per_hand", "mean"),
+            std_bb=("bb_per_hand", "std"),
+            sigma2_bb_per_hand=("bb_per_hand", "var"),
+            mu_usd_per_hand=("usd_per_hand", "mean"),
+            std_usd=("usd_per_hand", "std"),
+            sigma2_usd_per_hand=("usd_per_hand", "var"),
+            mean_hph=("hands_per_hour", "mean"),
+            total_bb_won=("bb_per_session", "sum"),
+            total_usd_won=("net_result", "sum"),
+        )
+        # Narrow enriched dtypes carry through groupby; widen the estimates
+        agg = agg.astype(
             {
-                "stake_text": stake,
-                "n_sessions": n_sessions,
-                "total_hands": total_hands,
-                "total_hours": stake_data["hours_played"].sum(),
-                "avg_session_hours": avg_hours,
-                # Win rate estimates (mu)
-                "mu_bb_per_hand": mu_bb_per_hand,
-                "mu_bb_ci_lower": mu_bb_ci_lower,
-                "mu_bb_ci_upper": mu_bb_ci_upper,
-                "mu_usd_per_hand": mu_usd_per_hand,
-                "mu_usd_ci_lower": mu_usd_ci_lower,
-                "mu_usd_ci_upper": mu_usd_ci_upper,
-                # Variance estimates (sigma^2)
-                "sigma2_bb_per_hand": session_bb_variance,
-                "sigma2_usd_per_hand": session_usd_variance,
-                # Derived metrics
-                "bb_per_hour": mu_bb_per_hand
-                * stake_data["hands_per_hour"].mean(),
-                "hourly_rate_usd": mu_usd_per_hand
-                * stake_data["hands_per_hour"].mean(),
-                # Totals
-                "total_bb_won": total_bb_won,
-                "total_usd_won": total_usd_won,
+                col: np.int64 if agg[col].dtype.kind in "iu" else np.float64
+                for col in agg.columns
             }
         )
 
-    return pd.DataFrame(estimates)
+    agg = agg[agg["n_sessions"] >= 3]  # Minimum sample size
+
+    # Confidence intervals; t.ppf takes the whole df vector in one call
+    confidence_level = 0.95
+    n_sessions = agg["n_sessions"].to_numpy()
+    t_critical = stats.t.ppf((1 + confidence_level) / 2, df=n_sessions - 1)
+    sqrt_n = np.sqrt(n_sessions)
+
+    mu_bb = agg["mu_bb_per_hand"].to_numpy()
+    ci_half_bb = t_critical * agg["std_bb"].to_numpy() / sqrt_n
+    mu_usd = agg["mu_usd_per_hand"].to_numpy()
+    ci_half_usd = t_critical * agg["std_usd"].to_numpy() / sqrt_n
+    mean_hph = agg["mean_hph"].to_numpy()
+
+    return pd.DataFrame(
+        {
+            "stake_text": agg.index.to_numpy(),
+            "n_sessions": n_sessions,
+            "total_hands": agg["total_hands"].to_numpy(),
+            "total_hours": agg["total_hours"].to_numpy(),
+            "avg_session_hours": agg["avg_session_hours"].to_numpy(),
+            # Win rate estimates (mu)
+            "mu_bb_per_hand": mu_bb,
+            "mu_bb_ci_lower": mu_bb - ci_half_bb,
+            "mu_bb_ci_upper": mu_bb + ci_half_bb,
+            "mu_usd_per_hand": mu_usd,
+            "mu_usd_ci_lower": mu_usd - ci_half_usd,
+            "mu_usd_ci_upper": mu_usd + ci_half_usd,
+            # Variance estimates (sigma^2)
+            "sigma2_bb_per_hand": agg["sigma2_bb_per_hand"].to_numpy(),
+            "sigma2_usd_per_hand": agg["sigma2_usd_per_hand"].to_numpy(),
+            # Derived metrics
+            "bb_per_hour": mu_bb * mean_hph,
+            "hourly_rate_usd": mu_usd * mean_hph,
+            # Totals
+            "total_bb_won": agg["total_bb_won"].to_numpy(),
+            "total_usd_won": agg["total_usd_won"].to_numpy(),
+        }
+    )
 
 
 def bootstrap_confidence_intervals(
@@ -104,35 +210,36 @@ def bootstrap_confidence_intervals(
     Returns:
         Dictionary with bootstrap results by stake
     """
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
 
     bootstrap_results = {}
 
-    for stake in df["stake_text"].unique():
-        stake_data = df[df["stake_text"] == stake]["bb_per_hand"].values
+    # One partition pass; groups come out in first-appearance order
+    grouped = df.groupby("stake_text", sort=False, observed=True)
+    for stake, stake_series in grouped["bb_per_hand"]:
+        stake_data = stake_series.to_numpy()
 
         if len(stake_data) < 5:  # Skip if too few samples
             continue
 
-        bootstrap_means = []
-
-        for _ in range(n_bootstrap):
-            bootstrap_sample = np.random.choice(
-                stake_data, size=len(stake_data), replace=True
-            )
-            bootstrap_means.append(np.mean(bootstrap_sample))
+        # Resample in blocks of rows so the index buffer stays cache-sized
+        n = len(stake_data)
+        bootstrap_means = np.empty(n_bootstrap)
+        for start in range(0, n_bootstrap, _BOOTSTRAP_BLOCK):
+            stop = min(start + _BOOTSTRAP_BLOCK, n_bootstrap)
+            idx = rng.integers(0, n, size=(stop - start, n))
+            bootstrap_means[start:stop] = _resample_means(stake_data, idx)
 
-        bootstrap_means = np.array(bootstrap_means)
+        p2_5, p10, p90, p97_5 = np.percentile(
+            bootstrap_means, [2.5, 10, 90, 97.5]
+        )
 
         bootstrap_results[stake] = {
             "mean": np.mean(bootstrap_means),
             "std": np.std(bootstrap_means),
-            "ci_lower": np.percentile(bootstrap_means, 2.5),
-            "ci_upper": np.percentile(bootstrap_means, 97.5),
-            "ci_10_90": (
-                np.percentile(bootstrap_means, 10),
-                np.percentile(bootstrap_means, 90),
-            ),
+            "ci_lower": p2_5,
+            "ci_upper": p97_5,
+            "ci_10_90": (p10, p90),
         }
 
     return bootstrap_results
@@ -150,12 +257,21 @@ def calculate_sharpe_ratios(estimates_df: pd.DataFrame) -> pd.DataFrame:
     """
     df = estimates_df.copy()
 
-    # Calculate Sharpe ratio (return / volatility)
-    df["sigma_bb_per_hand"] = np.sqrt(df["sigma2_bb_per_hand"])
-    df["sharpe_ratio"] = df["mu_bb_per_hand"] / df["sigma_bb_per_hand"]
+    mu = df["mu_bb_per_hand"].to_numpy(dtype=np.float64)
+    s2 = df["sigma2_bb_per_hand"].to_numpy(dtype=np.float64)
+
+    # Sharpe ratio (return / volatility); zero variance gives NaN, not inf
+    if HAS_NUMEXPR:
+        sharpe = ne.evaluate(
+            "where(s2 > 0.0, mu / sqrt(s2), nan)",
+            local_dict={"mu": mu, "s2": s2, "nan": np.nan},
+        )
+    else:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sharpe = np.where(s2 > 0.0, mu / np.sqrt(s2), np.nan)
 
-    # Handle division by zero
-    df["sharpe_ratio"] = df["sharpe_ratio"].replace([np.inf, -np.inf], np.nan)
+    df["sigma_bb_per_hand"] = np.sqrt(s2)
+    df["sharpe_ratio"] = sharpe
 
     return df
 
@@ -8,14 +8,24 @@ Merge September sessions from two sources:
 Output: Combined September P&L with hours, net, hourly, win rate
 """
 
+import json
 import os
+import numpy as np
 import pandas as pd
 import requests
-from io import StringIO
+from pathlib import Path
 from typing import Optional
 from dotenv import load_dotenv
 import re
 
+try:
+    from .enrich import HAS_PYARROW
+except ImportError:  # Run as a script from src/
+    from enrich import HAS_PYARROW
+
+# Parsed sheets are kept as parquet here between runs (needs pyarrow)
+DEFAULT_CACHE_DIR = Path("~/.cache/poker_ror").expanduser()
+
 
 def extract_sheet_id_from_url(url: str) -> str:
     """
@@ -39,13 +49,24 @@ def extract_sheet_id_from_url(url: str) -> str:
     raise ValueError(f"Could not extract sheet ID from URL: {url}")
 
 
-def load_google_sheet_csv(sheet_id: str, gid: str = "0") -> pd.DataFrame:
+def load_google_sheet_csv(
+    sheet_id: str,
+    gid: str = "0",
+    cache_dir: Optional[Path] = DEFAULT_CACHE_DIR,
+) -> pd.DataFrame:
     """
     Load a Google Sheet as CSV using the export URL.
 
+    Parsed sheets are cached as parquet keyed by (sheet_id, gid), with the
+    server's ETag and Last-Modified in a JSON file next to it. Later calls
+    send them back as a conditional GET (If-None-Match /
+    If-Modified-Since) and read the cache when the server answers 304 Not
+    Modified.
+
     Args:
         sheet_id: The Google Sheet ID from the URL
         gid: The specific sheet/tab ID (default "0" for first sheet)
+        cache_dir: Directory for the parquet cache; None disables caching
 
     Returns:
         DataFrame with the sheet data
@@ -54,10 +75,51 @@ def load_google_sheet_csv(sheet_id: str, gid: str = "0") -> pd.DataFrame:
         Sheet must be set to "Anyone with link can view" for this to work
     """
     url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/export?format=csv&gid={gid}"
-    response = requests.get(url)
-    response.raise_for_status()
+    # Arrow-backed columns keep the sheet's strings out of Python objects
+    read_kwargs = {"dtype_backend": "pyarrow"} if HAS_PYARROW else {}
+
+    use_cache = cache_dir is not None and HAS_PYARROW
+    headers = {}
+    if use_cache:
+        cache_path = Path(cache_dir) / f"{sheet_id}_{gid}.parquet"
+        validators_path = cache_path.with_suffix(".json")
+        # The validators file is only written after a complete parquet
+        # write, so its presence means the cache is usable
+        if cache_path.exists() and validators_path.exists():
+            validators = json.loads(validators_path.read_text())
+            if "ETag" in validators:
+                headers["If-None-Match"] = validators["ETag"]
+            if "Last-Modified" in validators:
+                headers["If-Modified-Since"] = validators["Last-Modified"]
+
+    # Let the C parser consume the byte stream directly
+    with requests.get(url, headers=headers, stream=True) as response:
+        if use_cache and response.status_code == 304:
+            return pd.read_parquet(cache_path, **read_kwargs)
+        response.raise_for_status()
+        response.raw.decode_content = True
+        df = pd.read_csv(response.raw, **read_kwargs)
+        validators = {
+            key: response.headers[key]
+            for key in ("ETag", "Last-Modified")
+            if key in response.headers
+        }
+
+    if use_cache:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Drop the old validators first and replace each file atomically,
+        # so an interrupted write leads to a full download next time
+        # rather than a 304 pointing at a truncated parquet
+        validators_path.unlink(missing_ok=True)
+        tmp_path = cache_path.with_suffix(".parquet.tmp")
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, cache_path)
+        if validators:
+            tmp_path = validators_path.with_suffix(".json.tmp")
+            tmp_path.write_text(json.dumps(validators))
+            os.replace(tmp_path, validators_path)
 
-    return pd.read_csv(StringIO(response.text))
+    return df
 
 
 def load_results_sept25_26(
@@ -158,24 +220,32 @@ def compute_september_summary(df: pd.DataFrame) -> dict:
     Returns:
         Dict with total_hours, total_net, hourly_rate, etc.
     """
+    # One pass over the four columns; NaN/NA cells are skipped like .sum()
+    totals = np.nansum(
+        df[["hours_played", "net_usd", "buyins_usd", "cashouts_usd"]].to_numpy(
+            dtype=np.float64, na_value=np.nan
+        ),
+        axis=0,
+    )
+    total_hours, total_net, total_buyins, total_cashouts = totals.tolist()
+
     summary = {
         "total_sessions": len(df),
-        "total_hours": df["hours_played"].sum(),
-        "total_net": df["net_usd"].sum(),
-        "total_buyins": df["buyins_usd"].sum(),
-        "total_cashouts": df["cashouts_usd"].sum(),
+        "total_hours": total_hours,
+        "total_net": total_net,
+        "total_buyins": total_buyins,
+        "total_cashouts": total_cashouts,
     }
 
-    summary["hourly_rate"] = (
-        summary["total_net"] / summary["total_hours"]
-        if summary["total_hours"] > 0
-        else 0
-    )
-    summary["roi"] = (
-        (summary["total_net"] / summary["total_buyins"] * 100)
-        if summary["total_buyins"] > 0
-        else 0
-    )
+    if total_hours > 0:
+        summary["hourly_rate"] = total_net / total_hours
+    else:
+        summary["hourly_rate"] = 0
+
+    if total_buyins > 0:
+        summary["roi"] = total_net / total_buyins * 100
+    else:
+        summary["roi"] = 0
 
     return summary
 
@@ -6,11 +6,74 @@ Functions for loading raw data, writing interim files, and reading processed dat
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Optional, List, Dict
 
+from .enrich import (
+    HAS_PYARROW,
+    STACK_DEPTH_LEVELS,
+    STRADDLE_LEVELS,
+    STRING_DTYPE,
+)
 
-def load_raw_session_data(data_dir: Path) -> pd.DataFrame:
+try:
+    import polars as pl
+
+    HAS_POLARS = True
+except ImportError:  # Optional dependency; pandas readers are used instead
+    HAS_POLARS = False
+
+# Low-cardinality string columns stored as pandas categoricals. Fixed level
+# orders come first so codes stay stable across loads; None means levels
+# are taken from the data.
+CATEGORICAL_COLUMNS = {
+    "stake_text": None,
+    "room": None,
+    "straddle_exposure": STRADDLE_LEVELS,
+    "stack_depth_class": STACK_DEPTH_LEVELS,
+}
+
+# Free-text columns stored as Arrow-backed strings when pyarrow is installed
+STRING_COLUMNS = ("notes",)
+
+# Small counts narrowed to the smallest integer dtype that holds them
+COUNT_COLUMNS = ("side_bombpots_count", "side_standup_minutes")
+
+
+def set_session_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert session string columns to compact dtypes in place.
+
+    Low-cardinality columns become categoricals; levels outside a fixed
+    order are appended after it rather than dropped. Free-text columns
+    use the Arrow-backed string dtype and count columns are downcast.
+
+    Args:
+        df: DataFrame with session data
+
+    Returns:
+        The same DataFrame, for chaining
+    """
+    for col, levels in CATEGORICAL_COLUMNS.items():
+        if col not in df.columns:
+            continue
+        if levels is None:
+            df[col] = df[col].astype("category")
+            continue
+        extra = sorted(set(df[col].dropna().unique()) - set(levels), key=str)
+        df[col] = df[col].astype(pd.CategoricalDtype(list(levels) + extra))
+    for col in STRING_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype(STRING_DTYPE)
+    for col in COUNT_COLUMNS:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], downcast="integer")
+    return df
+
+
+def load_raw_session_data(
+    data_dir: Path, use_polars: bool = True
+) -> pd.DataFrame:
     """
     Load and combine raw session data from multiple sources.
 
@@ -20,24 +83,70 @@ def load_raw_session_data(data_dir: Path) -> pd.DataFrame:
     side_bounty_flag, stack_depth_class, notes
 
     Args:
-        data_dir: Path to directory containing raw data files
+        data_dir: Path to directory containing raw data files (CSV, or
+            parquet, which is preferred over a CSV with the same name)
+        use_polars: Scan and combine the files with Polars when it and
+            pyarrow are installed (parallel parsing); otherwise read them
+            with pandas
 
     Returns:
         DataFrame with normalized session data
     """
+    # Handing the Polars result to pandas (to_pandas) needs pyarrow
+    use_polars = use_polars and HAS_POLARS and HAS_PYARROW
+
     # Check for existing raw data files
-    raw_files = list(data_dir.glob("*.csv"))
+    raw_files = _raw_session_files(data_dir, include_parquet=HAS_PYARROW)
 
     if not raw_files:
         print(
             "⚠️  No raw data files found. Creating sample data for demonstration."
         )
-        return create_sample_session_data()
+        return set_session_dtypes(create_sample_session_data())
 
-    # TODO: Implement actual data loading logic for CSV files
-    # This would handle different CSV formats and normalize them
     print(f"📄 Found {len(raw_files)} raw data files")
-    return create_sample_session_data()
+
+    if use_polars:
+        # Files may carry different column subsets; diagonal_relaxed fills
+        # missing columns with nulls and widens mismatched dtypes
+        frames = [
+            (
+                pl.scan_parquet(path)
+                if path.suffix == ".parquet"
+                else pl.scan_csv(
+                    path,
+                    # Dates stay strings; pd.to_datetime below parses
+                    # them the same way as the pandas path
+                    schema_overrides={"stake_text": pl.Categorical},
+                    infer_schema_length=1000,
+                )
+            )
+            for path in raw_files
+        ]
+        df = (
+            pl.concat(frames, how="diagonal_relaxed")
+            .collect(engine="streaming")
+            .to_pandas()
+        )
+    else:
+        df = pd.concat(
+            [read_table(path) for path in raw_files], ignore_index=True
+        )
+
+    try:
+        df["date"] = pd.to_datetime(df["date"]).dt.date
+    except ValueError:
+        # Files written with different date formats; infer per value
+        df["date"] = pd.to_datetime(df["date"], format="mixed").dt.date
+    return set_session_dtypes(df)
+
+
+def _raw_session_files(data_dir: Path, include_parquet: bool) -> List[Path]:
+    """Raw data files in data_dir, one per stem, parquet over CSV."""
+    files = {path.stem: path for path in data_dir.glob("*.csv")}
+    if include_parquet:
+        files.update({path.stem: path for path in data_dir.glob("*.parquet")})
+    return [files[stem] for stem in sorted(files)]
 
 
 def create_sample_session_data(
@@ -53,87 +162,108 @@ def create_sample_session_data(
     Returns:
         DataFrame with sample session data
     """
-    np.random.seed(seed)
+    rng = np.random.default_rng(seed)
 
     # Generate sessions over the past 2 years
-    start_date = datetime.now() - timedelta(days=730)
+    start_date = np.datetime64(datetime.now().date()) - np.timedelta64(
+        730, "D"
+    )
+    dates = start_date + rng.integers(0, 730, size=n_sessions).astype(
+        "timedelta64[D]"
+    )
 
-    dates = [
-        start_date + timedelta(days=np.random.randint(0, 730))
-        for _ in range(n_sessions)
-    ]
-    rooms = np.random.choice(
+    rooms = rng.choice(
         ["Aria", "Bellagio", "Commerce", "Borgata", "Local Club"], n_sessions
     )
-    stakes = np.random.choice(
-        ["1-3", "2-5", "2-5-10", "5-10", "10-20"],
-        n_sessions,
-        p=[0.3, 0.4, 0.2, 0.08, 0.02],
+
+    stake_order = np.array(["1-3", "2-5", "2-5-10", "5-10", "10-20"])
+    stake_codes = rng.choice(
+        len(stake_order), n_sessions, p=[0.3, 0.4, 0.2, 0.08, 0.02]
     )
+    stakes = stake_order[stake_codes]
+
+    # Generate realistic buy-ins and results, parameters gathered per stake;
+    # small positive expectation with high variance at every level
+    buyin_mu = np.array([300, 500, 800, 1500, 3000])[stake_codes]
+    buyin_sd = np.array([100, 150, 200, 300, 500])[stake_codes]
+    result_mu = np.array([15, 25, 40, 75, 150])[stake_codes]
+    result_sd = np.array([180, 250, 350, 600, 1200])[stake_codes]
 
-    # Generate realistic buy-ins and results
-    buyins = []
-    cashouts = []
-
-    for stake in stakes:
-        if stake == "1-3":
-            buyin = np.random.normal(300, 100)
-            result = np.random.normal(
-                15, 180
-            )  # Small positive expectation with high variance
-        elif stake == "2-5":
-            buyin = np.random.normal(500, 150)
-            result = np.random.normal(25, 250)
-        elif stake == "2-5-10":
-            buyin = np.random.normal(800, 200)
-            result = np.random.normal(40, 350)
-        elif stake == "5-10":
-            buyin = np.random.normal(1500, 300)
-            result = np.random.normal(75, 600)
-        else:  # 10-20
-            buyin = np.random.normal(3000, 500)
-            result = np.random.normal(150, 1200)
-
-        buyins.append(max(buyin, 100))  # Minimum buyin
-        cashouts.append(max(buyin + result, 0))  # Can't cash out negative
+    raw_buyins = rng.normal(buyin_mu, buyin_sd)
+    results = rng.normal(result_mu, result_sd)
+
+    buyins = np.maximum(raw_buyins, 100)  # Minimum buyin
+    cashouts = np.maximum(raw_buyins + results, 0)  # Can't cash out negative
 
     data = {
-        "date": [d.date() for d in dates],
+        "date": pd.DatetimeIndex(dates).date,
         "room": rooms,
         "stake_text": stakes,
-        "buyins_usd": [round(b, 2) for b in buyins],
-        "cashouts_usd": [round(c, 2) for c in cashouts],
-        "hours_played": np.random.normal(6, 2.5).clip(1, 12).round(1),
-        "straddle_exposure": np.random.choice(
+        "buyins_usd": buyins.round(2),
+        "cashouts_usd": cashouts.round(2),
+        "hours_played": rng.normal(6, 2.5, n_sessions).clip(1, 12).round(1),
+        "straddle_exposure": rng.choice(
             ["none", "low", "medium", "high", "mandatory"],
             n_sessions,
             p=[0.4, 0.2, 0.2, 0.15, 0.05],
         ),
-        "side_bombpots_count": np.random.poisson(3, n_sessions),
-        "side_standup_minutes": np.random.exponential(15, n_sessions).astype(
-            int
-        ),
-        "side_bounty_flag": np.random.choice(
+        "side_bombpots_count": rng.poisson(3, n_sessions),
+        "side_standup_minutes": rng.exponential(15, n_sessions).astype(int),
+        "side_bounty_flag": rng.choice(
             [True, False], n_sessions, p=[0.1, 0.9]
         ),
-        "stack_depth_class": np.random.choice(
+        "stack_depth_class": rng.choice(
             ["S", "N", "D", "VD"], n_sessions, p=[0.1, 0.6, 0.25, 0.05]
         ),
-        "notes": ["Sample session " + str(i) for i in range(n_sessions)],
+        "notes": pd.array(
+            ["Sample session " + str(i) for i in range(n_sessions)],
+            dtype=STRING_DTYPE,
+        ),
     }
 
     return pd.DataFrame(data)
 
 
+def write_table(df: pd.DataFrame, filepath: Path) -> None:
+    """
+    Write a DataFrame as parquet or CSV, chosen by the file suffix.
+
+    Parquet files are zstd-compressed and need pyarrow.
+
+    Args:
+        df: DataFrame to write
+        filepath: Destination ending in .parquet or .csv
+    """
+    if Path(filepath).suffix == ".parquet":
+        df.to_parquet(filepath, index=False, compression="zstd")
+    else:
+        df.to_csv(filepath, index=False)
+
+
+def read_table(filepath: Path) -> pd.DataFrame:
+    """
+    Read a DataFrame from parquet or CSV, chosen by the file suffix.
+
+    Args:
+        filepath: Source ending in .parquet or .csv
+
+    Returns:
+        DataFrame with the file contents
+    """
+    if Path(filepath).suffix == ".parquet":
+        return pd.read_parquet(filepath)
+    return pd.read_csv(filepath)
+
+
 def write_interim_data(df: pd.DataFrame, filepath: Path) -> None:
     """
     Write cleaned session data to interim storage.
 
     Args:
         df: DataFrame with cleaned session data
-        filepath: Path where to save the interim CSV file
+        filepath: Path where to save the interim file (.parquet or .csv)
     """
-    df.to_csv(filepath, index=False)
+    write_table(df, filepath)
     print(f"💾 Saved interim data to {filepath}")
 
 
@@ -142,7 +272,7 @@ def read_interim_data(filepath: Path) -> pd.DataFrame:
     Read cleaned session data from interim storage.
 
     Args:
-        filepath: Path to interim CSV file
+        filepath: Path to interim file (.parquet or .csv)
 
     Returns:
         DataFrame with session data
@@ -150,9 +280,9 @@ def read_interim_data(filepath: Path) -> pd.DataFrame:
     if not filepath.exists():
         raise FileNotFoundError(f"Interim data file not found: {filepath}")
 
-    df = pd.read_csv(filepath)
+    df = read_table(filepath)
     df["date"] = pd.to_datetime(df["date"]).dt.date
-    return df
+    return set_session_dtypes(df)
 
 
 def validate_session_data(df: pd.DataFrame) -> Dict[str, any]:
@@ -165,28 +295,39 @@ def validate_session_data(df: pd.DataFrame) -> Dict[str, any]:
     Returns:
         Dictionary with validation results
     """
+    # One reduction pass per column; the checks below reuse these values
+    report = df.agg(
+        {
+            "hours_played": ["min", "sum"],
+            "cashouts_usd": ["min", "sum"],
+            "buyins_usd": ["min", "sum"],
+        }
+    )
+    dates = df["date"]
+
     validation_report = {
         "total_sessions": len(df),
-        "date_range": (df["date"].min(), df["date"].max()),
+        "date_range": (dates.min(), dates.max()),
         "missing_values": df.isnull().sum().to_dict(),
-        "total_hours": df["hours_played"].sum(),
-        "total_net_result": (df["cashouts_usd"] - df["buyins_usd"]).sum(),
+        "total_hours": report.loc["sum", "hours_played"],
+        "total_net_result": report.loc["sum", "cashouts_usd"]
+        - report.loc["sum", "buyins_usd"],
         "stake_distribution": df["stake_text"].value_counts().to_dict(),
         "validation_errors": [],
     }
 
     # Check for common data issues
-    if df["hours_played"].min() <= 0:
+    if report.loc["min", "hours_played"] <= 0:
         validation_report["validation_errors"].append(
             "Invalid hours_played values found"
         )
 
-    if (df["cashouts_usd"] < 0).any():
+    if report.loc["min", "cashouts_usd"] < 0:
         validation_report["validation_errors"].append(
             "Negative cashout values found"
         )
 
-    if (df["buyins_usd"] <= 0).any():
+    if report.loc["min", "buyins_usd"] <= 0:
         validation_report["validation_errors"].append(
             "Invalid buyin values found"
         )
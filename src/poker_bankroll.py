@@ -3,17 +3,57 @@ Main module for Poker Bankroll Decision System.
 Coordinates the workflow: Import -> Enrich -> Estimate -> Simulate -> Report
 """
 
+import hashlib
+import shutil
 import yaml
 from pathlib import Path
 import pandas as pd
 
-from .io_ops import load_raw_session_data, validate_session_data
-from .enrich import enrich_session_data
+try:
+    from joblib import Memory
+
+    HAS_JOBLIB = True
+except ImportError:  # Optional dependency; stages are recomputed instead
+    HAS_JOBLIB = False
+
+from .io_ops import (
+    load_raw_session_data,
+    validate_session_data,
+    write_table,
+)
+from .enrich import HAS_PYARROW, enrich_session_data
 from .estimate import estimate_mu_sigma_by_stake, bootstrap_confidence_intervals
-from .simulate import run_stake_simulations
+from .simulate import simulate_path_stats, summarize_stake_simulations
 from .recommend import generate_stake_recommendations, create_decision_memo
 
 
+def _source_version() -> str:
+    """
+    Short hash of the simulation module source.
+
+    joblib keys cache entries on the cached function's own source only, so
+    edits to the helpers it calls would otherwise keep serving stale
+    results; the cache location includes this hash instead.
+    """
+    source = (Path(__file__).parent / "simulate.py").read_bytes()
+    return hashlib.sha256(source).hexdigest()[:12]
+
+
+def _simulation_cache(cache_root: Path) -> "Memory":
+    """
+    joblib Memory under cache_root/<source hash>.
+
+    Directories left by earlier versions of the simulation code can never
+    be hit again, so they are removed.
+    """
+    version = _source_version()
+    if cache_root.is_dir():
+        for path in cache_root.iterdir():
+            if path.is_dir() and path.name != version:
+                shutil.rmtree(path, ignore_errors=True)
+    return Memory(cache_root / version, verbose=0)
+
+
 def load_config(config_path: Path) -> dict:
     """Load configuration from YAML file."""
     with open(config_path, "r") as f:
@@ -23,12 +63,14 @@ def load_config(config_path: Path) -> dict:
 class PokerBankrollAnalyzer:
     """Main class for poker bankroll analysis."""
 
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, use_cache: bool = True):
         """
         Initialize the analyzer.
 
         Args:
             project_root: Path to project root directory
+            use_cache: Memoize simulated path stats on disk under
+                data/interim/cache (requires joblib)
         """
         self.project_root = Path(project_root)
         self.data_raw = self.project_root / "data" / "raw"
@@ -50,9 +92,19 @@ class PokerBankrollAnalyzer:
                     "risk_tolerance": 0.05,
                     "drawdown_thresholds": [10, 20, 30, 50],
                     "kelly_fraction": 0.25,
+                    "ror_method": "simulated",
                 }
             }
 
+        # On-disk memoization of the simulation stage. Only its inputs are
+        # small enough to hash cheaply; the session frames cost more to
+        # hash than to process.
+        self.memory = (
+            _simulation_cache(self.data_interim / "cache")
+            if use_cache and HAS_JOBLIB
+            else None
+        )
+
         # Storage for analysis results
         self.raw_sessions = None
         self.enriched_sessions = None
@@ -60,6 +112,10 @@ class PokerBankrollAnalyzer:
         self.simulation_results = None
         self.recommendations = None
 
+    def _cached(self, func):
+        """Return func memoized on disk, or func itself without a cache."""
+        return self.memory.cache(func) if self.memory is not None else func
+
     def import_data(self) -> pd.DataFrame:
         """Import and validate raw session data."""
         print("🔄 Step 1: Importing session data...")
@@ -122,8 +178,16 @@ class PokerBankrollAnalyzer:
         if self.stake_estimates is None:
             raise ValueError("Must estimate parameters first")
 
-        self.simulation_results = run_stake_simulations(
-            self.stake_estimates, self.config["simulation"]
+        # Path stats do not depend on the bankroll, so only the cheap
+        # summary reruns when current_bankroll_bb or risk settings change
+        sim_config = self.config["simulation"]
+        path_stats = self._cached(simulate_path_stats)(
+            self.stake_estimates,
+            sim_config["n_simulations"],
+            sim_config["time_horizons"],
+        )
+        self.simulation_results = summarize_stake_simulations(
+            self.stake_estimates, path_stats, sim_config
         )
 
         n_simulations = self.config["simulation"]["n_simulations"]
@@ -181,25 +245,38 @@ class PokerBankrollAnalyzer:
             "decision_memo": memo,
         }
 
-    def save_results(self, results: dict) -> None:
-        """Save analysis results to files."""
-        # Save interim data
-        interim_file = self.data_interim / "enriched_sessions.csv"
-        results["enriched_sessions"].to_csv(interim_file, index=False)
+    def save_results(self, results: dict, write_csv: bool = False) -> None:
+        """
+        Save analysis results to files.
+
+        Tables are written as zstd parquet when pyarrow is installed,
+        otherwise as CSV.
+
+        Args:
+            results: Dictionary returned by run_full_analysis
+            write_csv: Also write CSV copies next to the parquet files
+        """
+        suffixes = [".parquet"] if HAS_PYARROW else []
+        if write_csv or not HAS_PYARROW:
+            suffixes.append(".csv")
 
-        # Save processed results
         processed_dir = self.data_processed
         processed_dir.mkdir(exist_ok=True)
 
-        results["stake_estimates"].to_csv(
-            processed_dir / "stake_estimates.csv", index=False
-        )
-        results["simulation_results"].to_csv(
-            processed_dir / "simulation_results.csv", index=False
-        )
-        results["recommendations"].to_csv(
-            processed_dir / "recommendations.csv", index=False
-        )
+        for suffix in suffixes:
+            # Save interim data
+            write_table(
+                results["enriched_sessions"],
+                self.data_interim / f"enriched_sessions{suffix}",
+            )
+
+            # Save processed results
+            for name in (
+                "stake_estimates",
+                "simulation_results",
+                "recommendations",
+            ):
+                write_table(results[name], processed_dir / f"{name}{suffix}")
 
         # Save decision memo
         memo_file = self.project_root / "bankroll_decision_memo.md"
@@ -8,6 +8,15 @@ import numpy as np
 from datetime import datetime
 from typing import Dict
 
+# Memo marker for each recommendation level
+STATUS_EMOJI = {
+    "RECOMMENDED": "✅",
+    "ACCEPTABLE": "⚠️",
+    "MARGINAL": "🔸",
+    "NOT RECOMMENDED": "❌",
+    "UNDERFUNDED": "💰",
+}
+
 
 def generate_stake_recommendations(
     simulation_df: pd.DataFrame,
@@ -27,53 +36,72 @@ def generate_stake_recommendations(
     Returns:
         DataFrame with recommendations for each stake
     """
-    recommendations = []
-
-    for _, row in simulation_df.iterrows():
-        stake = row["stake_text"]
-
-        # Get risk metrics for 10,000 hand horizon (long-term)
-        ror_10k = row.get("ror_10000h", float("inf"))
-        expected_final = row.get("final_mean_10000h", current_bankroll_bb)
-
-        # Calculate bankroll requirements (conservative estimates)
-        min_bankroll_buyins = 25  # Conservative minimum
-        min_bankroll_bb = min_bankroll_buyins * 100  # 100BB per buyin
-
-        # Recommendation logic
-        if ror_10k <= risk_tolerance and current_bankroll_bb >= min_bankroll_bb:
-            if row["mu"] > 0:
-                recommendation = "RECOMMENDED"
-                reason = f"Low risk ({ror_10k:.1%}), positive expectation (+{row['mu']:.4f} BB/hand)"
-            else:
-                recommendation = "MARGINAL"
-                reason = f"Low risk but negative expectation ({row['mu']:.4f} BB/hand)"
-        elif ror_10k <= risk_tolerance * 2:  # Slightly higher risk tolerance
-            recommendation = "ACCEPTABLE"
-            reason = f"Moderate risk ({ror_10k:.1%}), monitor closely"
-        else:
-            recommendation = "NOT RECOMMENDED"
-            reason = f"High risk of ruin ({ror_10k:.1%})"
-
-        if current_bankroll_bb < min_bankroll_bb:
-            recommendation = "UNDERFUNDED"
-            reason = f"Insufficient bankroll (need {min_bankroll_bb:.0f}BB, have {current_bankroll_bb:.0f}BB)"
-
-        recommendations.append(
-            {
-                "stake_text": stake,
-                "recommendation": recommendation,
-                "reason": reason,
-                "ror_10k_hands": ror_10k,
-                "expected_return_bb_per_hand": row["mu"],
-                "min_bankroll_bb": min_bankroll_bb,
-                "current_bankroll_sufficient": current_bankroll_bb
-                >= min_bankroll_bb,
-                "expected_bb_after_10k": expected_final,
-            }
+    n_stakes = len(simulation_df)
+    mu = simulation_df["mu"].to_numpy()
+
+    # Get risk metrics for 10,000 hand horizon (long-term)
+    if "ror_10000h" in simulation_df:
+        ror_10k = simulation_df["ror_10000h"].to_numpy(dtype=np.float64)
+    else:
+        ror_10k = np.full(n_stakes, np.inf)
+    if "final_mean_10000h" in simulation_df:
+        expected_final = simulation_df["final_mean_10000h"].to_numpy()
+    else:
+        expected_final = np.full(n_stakes, current_bankroll_bb)
+
+    # Calculate bankroll requirements (conservative estimates)
+    min_bankroll_buyins = 25  # Conservative minimum
+    min_bankroll_bb = min_bankroll_buyins * 100  # 100BB per buyin
+    funded = current_bankroll_bb >= min_bankroll_bb
+
+    # Recommendation logic, as masks over all stakes at once
+    low_risk = (ror_10k <= risk_tolerance) & funded
+    moderate_risk = ~low_risk & (ror_10k <= risk_tolerance * 2)
+    conditions = [low_risk & (mu > 0), low_risk & ~(mu > 0), moderate_risk]
+
+    ror_text = pd.Series(ror_10k).map("{:.1%}".format).to_numpy(object)
+    mu_text = pd.Series(mu).map("{:.4f}".format).to_numpy(object)
+
+    recommendation = np.select(
+        conditions,
+        ["RECOMMENDED", "MARGINAL", "ACCEPTABLE"],
+        default="NOT RECOMMENDED",
+    ).astype(object)
+    reason = np.select(
+        conditions,
+        [
+            "Low risk ("
+            + ror_text
+            + "), positive expectation (+"
+            + mu_text
+            + " BB/hand)",
+            "Low risk but negative expectation (" + mu_text + " BB/hand)",
+            "Moderate risk (" + ror_text + "), monitor closely",
+        ],
+        default="High risk of ruin (" + ror_text + ")",
+    ).astype(object)
+
+    if not funded:
+        recommendation[:] = "UNDERFUNDED"
+        reason[:] = (
+            f"Insufficient bankroll (need {min_bankroll_bb:.0f}BB, "
+            f"have {current_bankroll_bb:.0f}BB)"
         )
 
-    return pd.DataFrame(recommendations).sort_values("ror_10k_hands")
+    recommendations = pd.DataFrame(
+        {
+            "stake_text": simulation_df["stake_text"].to_numpy(),
+            "recommendation": recommendation,
+            "reason": reason,
+            "ror_10k_hands": ror_10k,
+            "expected_return_bb_per_hand": mu,
+            "min_bankroll_bb": min_bankroll_bb,
+            "current_bankroll_sufficient": funded,
+            "expected_bb_after_10k": expected_final,
+        }
+    )
+
+    return recommendations.sort_values("ror_10k_hands")
 
 
 def create_decision_memo(
@@ -94,15 +122,24 @@ def create_decision_memo(
     Returns:
         Formatted decision memo as string
     """
-    memo = f"""
+    # Session totals, each computed once
+    n_sessions = len(enriched_sessions)
+    total_hours = enriched_sessions["hours_played"].sum()
+    date_min, date_max = enriched_sessions["date"].agg(["min", "max"])
+    net_result = enriched_sessions["net_result"].sum()
+
+    # Sections are collected and joined once at the end
+    parts = [
+        f"""
 # POKER BANKROLL DECISION MEMO
 Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}
 Current Bankroll: {current_bankroll_bb:,.0f} BB
 
 ## EXECUTIVE SUMMARY
-Based on {len(enriched_sessions)} sessions and {enriched_sessions['hours_played'].sum():.0f} hours of data:
+Based on {n_sessions} sessions and {total_hours:.0f} hours of data:
 
 """
+    ]
 
     # Find best recommendation
     recommended = recommendations_df[
@@ -110,60 +147,62 @@ Based on {len(enriched_sessions)} sessions and {enriched_sessions['hours_played'
     ]
     if len(recommended) > 0:
         best_stake = recommended.iloc[0]
-        memo += f"""
+        parts.append(
+            f"""
 **PRIMARY RECOMMENDATION: {best_stake['stake_text']}**
 - Risk of Ruin (10K hands): {best_stake['ror_10k_hands']:.1%}
 - Expected Return: {best_stake['expected_return_bb_per_hand']:.4f} BB/hand
 - Reason: {best_stake['reason']}
 
 """
+        )
     else:
-        memo += """
+        parts.append(
+            """
 **NO STAKES CURRENTLY RECOMMENDED**
 All analyzed stakes exceed acceptable risk thresholds or show negative expectation.
 Consider building bankroll at lower stakes or improving play.
 
 """
+        )
 
-    memo += "## STAKE ANALYSIS\n\n"
+    parts.append("## STAKE ANALYSIS\n\n")
 
-    for _, row in recommendations_df.iterrows():
-        status_emoji = {
-            "RECOMMENDED": "✅",
-            "ACCEPTABLE": "⚠️",
-            "MARGINAL": "🔸",
-            "NOT RECOMMENDED": "❌",
-            "UNDERFUNDED": "💰",
-        }.get(row["recommendation"], "❓")
+    for row in recommendations_df.itertuples(index=False):
+        status_emoji = STATUS_EMOJI.get(row.recommendation, "❓")
 
-        memo += f"""
-**{status_emoji} {row['stake_text']} - {row['recommendation']}**
-- Risk of Ruin: {row['ror_10k_hands']:.1%}
-- Expected Return: {row['expected_return_bb_per_hand']:.4f} BB/hand
-- Min Bankroll: {row['min_bankroll_bb']:.0f} BB
-- Assessment: {row['reason']}
+        parts.append(
+            f"""
+**{status_emoji} {row.stake_text} - {row.recommendation}**
+- Risk of Ruin: {row.ror_10k_hands:.1%}
+- Expected Return: {row.expected_return_bb_per_hand:.4f} BB/hand
+- Min Bankroll: {row.min_bankroll_bb:.0f} BB
+- Assessment: {row.reason}
 
 """
+        )
 
-    memo += f"""
+    parts.append(
+        f"""
 ## RISK PARAMETERS
 - Risk Tolerance: {config['risk_tolerance']:.1%}
 - Simulation Runs: {config['n_simulations']:,}
 - Time Horizon: {max(config['time_horizons']):,} hands
 
 ## DATA QUALITY
-- Total Sessions: {len(enriched_sessions)}
-- Date Range: {enriched_sessions['date'].min()} to {enriched_sessions['date'].max()}
-- Total Hours: {enriched_sessions['hours_played'].sum():.0f}
-- Net Result: ${enriched_sessions['net_result'].sum():.2f}
+- Total Sessions: {n_sessions}
+- Date Range: {date_min} to {date_max}
+- Total Hours: {total_hours:.0f}
+- Net Result: ${net_result:.2f}
 
 ---
 *This analysis is based on historical performance and Monte Carlo simulation. 
 Past results do not guarantee future performance. 
 Always play within your means and maintain proper bankroll management.*
 """
+    )
 
-    return memo
+    return "".join(parts)
 
 
 def create_summary_table(recommendations_df: pd.DataFrame) -> pd.DataFrame:
@@ -0,0 +1,66 @@
+"""
+Column-oriented container for enriched session data.
+Holds only the columns the estimation step reads, as contiguous numpy arrays.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+def _ascontig(col: pd.Series) -> np.ndarray:
+    """Column values as a C-contiguous array, copying only if needed."""
+    values = col.to_numpy(copy=False)
+    return np.ascontiguousarray(values, dtype=values.dtype)
+
+
+@dataclass
+class Sessions:
+    """
+    Enriched sessions stored as one numpy array per column.
+
+    stake_code indexes into stake_levels in order of first appearance;
+    sessions without a stake have code -1.
+    """
+
+    stake_code: np.ndarray
+    stake_levels: np.ndarray
+    hands_played: np.ndarray
+    hours_played: np.ndarray
+    hands_per_hour: np.ndarray
+    bb_per_hand: np.ndarray
+    usd_per_hand: np.ndarray
+    bb_per_session: np.ndarray
+    net_result: np.ndarray
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> "Sessions":
+        """
+        Build from an enriched session DataFrame.
+
+        Columns sliced out of pandas blocks can be strided; each array is
+        made C-contiguous here so downstream reductions stream memory.
+
+        Args:
+            df: DataFrame produced by enrich_session_data
+
+        Returns:
+            Sessions with one array per needed column
+        """
+        codes, levels = pd.factorize(df["stake_text"])
+
+        return cls(
+            stake_code=codes,
+            stake_levels=np.asarray(levels, dtype=object),
+            hands_played=_ascontig(df["hands_played"]),
+            hours_played=_ascontig(df["hours_played"]),
+            hands_per_hour=_ascontig(df["hands_per_hour"]),
+            bb_per_hand=_ascontig(df["bb_per_hand"]),
+            usd_per_hand=_ascontig(df["usd_per_hand"]),
+            bb_per_session=_ascontig(df["bb_per_session"]),
+            net_result=_ascontig(df["net_result"]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.stake_code)
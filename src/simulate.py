@@ -3,9 +3,169 @@ Monte Carlo simulation functions for bankroll analysis.
 Risk of ruin and drawdown probability calculations.
 """
 
+import os
 import numpy as np
 import pandas as pd
-from typing import List, Dict, Tuple
+from scipy import stats
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple, Union
+
+try:
+    from numba import njit
+
+    HAS_NUMBA = True
+except ImportError:  # Optional dependency; numpy fallbacks are used instead
+    HAS_NUMBA = False
+
+# Paths simulated per task; each task has its own seed, so results depend
+# on this size but not on the number of worker threads
+_SIM_CHUNK_PATHS = 1000
+
+# Most hands drawn at once per path by the streaming simulation
+_STREAM_BLOCK = 1024
+
+
+def _make_rng(seed) -> np.random.Generator:
+    """
+    Generator on the SFC64 bit generator.
+
+    SFC64 is faster than the default PCG64 for bulk normal draws, and
+    statistical (not cryptographic) quality is all the simulation needs.
+    """
+    return np.random.Generator(np.random.SFC64(seed))
+
+
+if HAS_NUMBA:
+
+    # Serial and GIL-free: run_stake_simulations runs many of these at once
+    # from worker threads. cache=True keeps the compiled kernel on disk
+    # across runs.
+    @njit(nogil=True, cache=True, boundscheck=False)
+    def _stream_path_stats_numba(
+        mu: float,
+        sigma: float,
+        initial_bankroll: float,
+        edges: np.ndarray,
+        is_checkpoint: np.ndarray,
+        n_paths: int,
+        rng: np.random.Generator,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Scalar-state version of the segment loop in _stream_path_stats."""
+        n_checks = is_checkpoint.sum()
+        mins = np.empty((n_paths, n_checks))
+        max_dds = np.empty((n_paths, n_checks))
+        levels = np.empty((n_paths, n_checks))
+        balance = np.full(n_paths, initial_bankroll)
+        lo = balance.copy()
+        hi = balance.copy()
+        dd = np.zeros(n_paths)
+
+        c = 0
+        for s in range(len(edges)):
+            if s > 0:
+                # Paths outer, hands inner: same draw order as a
+                # (n_paths, n_hands) standard_normal block
+                for i in range(n_paths):
+                    b, l, h, d = balance[i], lo[i], hi[i], dd[i]
+                    for _ in range(edges[s] - edges[s - 1]):
+                        b += mu + sigma * rng.standard_normal()
+                        if b < l:
+                            l = b
+                        if b > h:
+                            h = b
+                        if h - b > d:
+                            d = h - b
+                    balance[i], lo[i], hi[i], dd[i] = b, l, h, d
+            if is_checkpoint[s]:
+                mins[:, c] = lo
+                max_dds[:, c] = dd
+                levels[:, c] = balance
+                c += 1
+        return mins, max_dds, levels
+
+    # Compile (or load from the on-disk cache) at import with the same
+    # argument types as real calls, so the first simulation skips the JIT
+    _stream_path_stats_numba(
+        0.0,
+        1.0,
+        1.0,
+        np.array([0, 1], dtype=np.int64),
+        np.array([True, True]),
+        1,
+        _make_rng(0),
+    )
+
+
+def _stream_path_stats(
+    mu: float,
+    sigma: float,
+    initial_bankroll: float,
+    checkpoints: np.ndarray,
+    n_paths: int,
+    rng: np.random.Generator,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Simulate paths keeping only running state, recording checkpoint stats.
+
+    Per path this tracks the balance, its running minimum and maximum, and
+    the maximum drawdown so far; the full path is never stored. Returns
+    (min, max drawdown, balance) arrays of shape (n_paths, n_checkpoints),
+    each covering hands 0..checkpoint.
+
+    Args:
+        checkpoints: Ascending, unique hand counts to record at
+    """
+    # Hands are drawn in segments ending at each checkpoint and at least
+    # every _STREAM_BLOCK hands, bounding the numpy fallback's buffer
+    n_hands = int(checkpoints[-1])
+    edges = np.unique(
+        np.concatenate(
+            [np.arange(0, n_hands, _STREAM_BLOCK), checkpoints, [n_hands]]
+        )
+    ).astype(np.int64)
+    is_checkpoint = np.isin(edges, checkpoints)
+
+    if HAS_NUMBA:
+        return _stream_path_stats_numba(
+            float(mu),
+            float(sigma),
+            float(initial_bankroll),
+            edges,
+            is_checkpoint,
+            n_paths,
+            rng,
+        )
+
+    balance = np.full(n_paths, float(initial_bankroll))
+    lo = balance.copy()
+    hi = balance.copy()
+    dd = np.zeros(n_paths)
+    mins, max_dds, levels = [], [], []
+    for s in range(len(edges)):
+        if s > 0:
+            # Seeding the first step with the balance makes cumsum add in
+            # the same order as the scalar kernel
+            steps = rng.standard_normal((n_paths, edges[s] - edges[s - 1]))
+            steps *= sigma
+            steps += mu
+            steps[:, 0] += balance
+            np.cumsum(steps, axis=1, out=steps)
+
+            running_max = np.maximum.accumulate(steps, axis=1)
+            np.maximum(running_max, hi[:, None], out=running_max)
+            np.minimum(lo, steps.min(axis=1), out=lo)
+            np.maximum(dd, (running_max - steps).max(axis=1), out=dd)
+            hi = running_max[:, -1].copy()
+            balance = steps[:, -1].copy()
+        if is_checkpoint[s]:
+            mins.append(lo.copy())
+            max_dds.append(dd.copy())
+            levels.append(balance.copy())
+    return (
+        np.column_stack(mins),
+        np.column_stack(max_dds),
+        np.column_stack(levels),
+    )
 
 
 def simulate_bankroll_paths(
@@ -14,6 +174,7 @@ def simulate_bankroll_paths(
     initial_bankroll: float,
     n_hands: int,
     n_simulations: int = 10000,
+    rng: Optional[np.random.Generator] = None,
 ) -> np.ndarray:
     """
     Simulate bankroll paths using random walk with drift.
@@ -24,45 +185,107 @@ def simulate_bankroll_paths(
         initial_bankroll: Starting bankroll (in BB)
         n_hands: Number of hands to simulate
         n_simulations: Number of simulation paths
+        rng: Random generator to draw from; a fresh SFC64 one seeded with
+            42 is used if omitted, for reproducible results
 
     Returns:
-        Array of shape (n_simulations, n_hands + 1) with bankroll paths
+        float32 array of shape (n_simulations, n_hands + 1) with bankroll
+        paths
     """
-    np.random.seed(42)  # For reproducible results
+    if rng is None:
+        rng = _make_rng(42)
+
+    # float32 halves memory traffic; outputs are read to ~3 significant
+    # figures, well within single precision
+    mu = np.float32(mu)
+    sigma = np.float32(sigma)
+
+    # One buffer, filled whole because the generator needs contiguous
+    # output; column 0 is then overwritten with the starting bankroll so a
+    # single in-place cumsum turns per-hand returns into bankroll levels
+    bankroll_paths = np.empty((n_simulations, n_hands + 1), dtype=np.float32)
+    rng.standard_normal(dtype=np.float32, out=bankroll_paths)
+    bankroll_paths *= sigma
+    bankroll_paths += mu
+    bankroll_paths[:, 0] = np.float32(initial_bankroll)
+    np.cumsum(bankroll_paths, axis=1, out=bankroll_paths)
 
-    # Generate random returns for each hand
-    returns = np.random.normal(mu, sigma, (n_simulations, n_hands))
+    return bankroll_paths
 
-    # Calculate cumulative returns
-    cumulative_returns = np.cumsum(returns, axis=1)
 
-    # Add initial bankroll
-    bankroll_paths = np.column_stack(
-        [
-            np.full(n_simulations, initial_bankroll),
-            initial_bankroll + cumulative_returns,
-        ]
-    )
+def analytical_risk_of_ruin(
+    mu: np.ndarray, sigma: np.ndarray, bankroll: float, n_hands: int
+) -> np.ndarray:
+    """
+    Closed-form risk of ruin within n_hands for a Brownian bankroll.
 
-    return bankroll_paths
+    Treats the bankroll as Brownian motion with drift mu and volatility
+    sigma per hand; by the reflection principle the probability of
+    touching zero from a start of B within n hands is
+
+        Phi((-B - mu*n) / (sigma*sqrt(n)))
+        + exp(-2*mu*B / sigma^2) * Phi((-B + mu*n) / (sigma*sqrt(n)))
+
+    The second term is evaluated in log space so large negative drift
+    does not overflow. Discrete per-hand steps ruin slightly less often
+    than the continuous path, so this is a mild upper bound on the
+    simulated value.
+
+    Args:
+        mu: Expected return per hand (in BB), scalar or per-stake array
+        sigma: Standard deviation per hand (in BB), same shape as mu
+        bankroll: Starting bankroll (in BB)
+        n_hands: Horizon in hands
+
+    Returns:
+        Probability of ruin (0.0 to 1.0), same shape as mu
+    """
+    mu = np.asarray(mu, dtype=np.float64)
+    sigma = np.asarray(sigma, dtype=np.float64)
+    if bankroll <= 0:
+        return np.ones_like(mu)
+    if n_hands <= 0:
+        return np.zeros_like(mu)
+
+    spread = sigma * np.sqrt(n_hands)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        direct = stats.norm.cdf((-bankroll - mu * n_hands) / spread)
+        reflected = np.exp(
+            -2.0 * mu * bankroll / sigma**2
+            + stats.norm.logcdf((-bankroll + mu * n_hands) / spread)
+        )
+    # sigma == 0 is a deterministic walk: only the direct term applies
+    reflected = np.where(np.isnan(reflected), 0.0, reflected)
+    return np.clip(direct + reflected, 0.0, 1.0)
 
 
 def calculate_risk_of_ruin(
-    bankroll_paths: np.ndarray, ruin_threshold: float = 0
-) -> float:
+    bankroll_paths: np.ndarray, ruin_threshold: Union[float, np.ndarray] = 0
+) -> Union[float, np.ndarray]:
     """
     Calculate the probability of bankroll going below ruin threshold.
 
+    Paths simulated from initial_bankroll=0 serve every bankroll B at
+    once: pass ruin_threshold=-B, or an array of -B values for a sweep.
+
     Args:
         bankroll_paths: Array of bankroll simulation paths
-        ruin_threshold: Bankroll level considered "ruin"
+        ruin_threshold: Bankroll level considered "ruin", scalar or array
 
     Returns:
-        Probability of ruin (0.0 to 1.0)
+        Probability of ruin (0.0 to 1.0), one per threshold for an array
     """
     min_bankrolls = np.min(bankroll_paths, axis=1)
-    ruin_count = np.sum(min_bankrolls <= ruin_threshold)
-    return ruin_count / len(bankroll_paths)
+    if np.ndim(ruin_threshold) == 0:
+        ruin_count = np.sum(min_bankrolls <= ruin_threshold)
+        return ruin_count / len(bankroll_paths)
+
+    # Sort once; each threshold is then a binary search
+    min_bankrolls.sort()
+    ruin_counts = np.searchsorted(
+        min_bankrolls, np.asarray(ruin_threshold), side="right"
+    )
+    return ruin_counts / len(bankroll_paths)
 
 
 def calculate_drawdown_probabilities(
@@ -78,85 +301,213 @@ def calculate_drawdown_probabilities(
     Returns:
         Dictionary mapping drawdown threshold to probability
     """
-    drawdown_probs = {}
+    # Maximum drawdown per path, computed once for all thresholds
+    running_max = np.maximum.accumulate(bankroll_paths, axis=1)
+    drawdowns = np.subtract(running_max, bankroll_paths, out=running_max)
+    max_drawdowns = np.max(drawdowns, axis=1)
 
-    for threshold in drawdown_thresholds:
-        # Calculate maximum drawdown for each path
-        running_max = np.maximum.accumulate(bankroll_paths, axis=1)
-        drawdowns = running_max - bankroll_paths
-        max_drawdowns = np.max(drawdowns, axis=1)
-
-        # Count paths with drawdown >= threshold
-        drawdown_count = np.sum(max_drawdowns >= threshold)
-        drawdown_probs[threshold] = drawdown_count / len(bankroll_paths)
+    # Fraction of paths with drawdown >= each threshold
+    thresholds = np.asarray(drawdown_thresholds)
+    probs = np.mean(max_drawdowns[:, None] >= thresholds[None, :], axis=0)
+    drawdown_probs = dict(zip(drawdown_thresholds, probs.tolist()))
 
     return drawdown_probs
 
 
-def run_stake_simulations(
-    estimates_df: pd.DataFrame, config: Dict
+def _simulate_chunk_stats(
+    mu: float,
+    sigma: float,
+    initial_bankroll: float,
+    horizons: np.ndarray,
+    n_paths: int,
+    seed: np.random.SeedSequence,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Simulate one block of paths straight to checkpoint stats."""
+    return _stream_path_stats(
+        mu,
+        sigma,
+        initial_bankroll,
+        horizons,
+        n_paths,
+        _make_rng(seed),
+    )
+
+
+def simulate_path_stats(
+    estimates_df: pd.DataFrame,
+    n_simulations: int,
+    time_horizons: List[int],
+    n_workers: Optional[int] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Simulate zero-origin paths for every stake, keeping checkpoint stats.
+
+    A bankroll path is the zero-origin walk shifted by the starting
+    bankroll B, so running minima and final levels shift by B and maximum
+    drawdowns do not change at all. These stats therefore serve any
+    bankroll: ruin at B is min <= -B. Stakes are split into blocks of
+    paths that run on a thread pool; the RNG fill, cumsum and stats
+    kernel all release the GIL.
+
+    Args:
+        estimates_df: DataFrame with mu/sigma estimates by stake
+        n_simulations: Number of simulation paths per stake
+        time_horizons: Hand counts to record stats at
+        n_workers: Worker threads (default: one per CPU)
+
+    Returns:
+        (min, max drawdown, final level) arrays of shape
+        (n_stakes, n_simulations, n_horizons), horizons ascending
+    """
+    horizons = np.unique(time_horizons)
+    mu = estimates_df["mu_bb_per_hand"].to_numpy(dtype=np.float64)
+    sigma = np.sqrt(
+        estimates_df["sigma2_bb_per_hand"].to_numpy(dtype=np.float64)
+    )
+    n_stakes = len(mu)
+
+    # Stream each path once to the longest horizon, recording stats at
+    # every shorter one; only O(n_simulations * n_horizons) is kept. Paths
+    # run in independent blocks, each with its own child seed, so runs are
+    # reproducible for any worker count.
+    tasks = [
+        (stake, lo, min(lo + _SIM_CHUNK_PATHS, n_simulations))
+        for stake in range(n_stakes)
+        for lo in range(0, n_simulations, _SIM_CHUNK_PATHS)
+    ]
+    seeds = np.random.SeedSequence(42).spawn(len(tasks))
+
+    stats_shape = (n_stakes, n_simulations, len(horizons))
+    mins = np.empty(stats_shape)
+    max_dds = np.empty(stats_shape)
+    levels = np.empty(stats_shape)
+    with ThreadPoolExecutor(max_workers=n_workers or os.cpu_count()) as pool:
+        futures = [
+            pool.submit(
+                _simulate_chunk_stats,
+                mu[stake],
+                sigma[stake],
+                0.0,
+                horizons,
+                hi - lo,
+                seed,
+            )
+            for (stake, lo, hi), seed in zip(tasks, seeds)
+        ]
+        for (stake, lo, hi), future in zip(tasks, futures):
+            for out, stat in zip((mins, max_dds, levels), future.result()):
+                out[stake, lo:hi] = stat
+
+    return mins, max_dds, levels
+
+
+def summarize_stake_simulations(
+    estimates_df: pd.DataFrame,
+    path_stats: Tuple[np.ndarray, np.ndarray, np.ndarray],
+    config: Dict,
 ) -> pd.DataFrame:
     """
-    Run Monte Carlo simulations for all stake levels.
+    Turn zero-origin path stats into per-stake results for one bankroll.
+
+    Only shifts and compares the stats from simulate_path_stats, so
+    sweeping config["current_bankroll_bb"] needs no new simulation.
 
     Args:
         estimates_df: DataFrame with mu/sigma estimates by stake
+        path_stats: Output of simulate_path_stats for estimates_df
         config: Simulation configuration dictionary
 
     Returns:
         DataFrame with simulation results for each stake
     """
-    simulation_results = []
+    mins, max_dds, levels = path_stats
+    bankroll = config["current_bankroll_bb"]
+    horizons = np.unique(config["time_horizons"])
+    thresholds = np.asarray(config["drawdown_thresholds"])
+
+    sigma2 = estimates_df["sigma2_bb_per_hand"].to_numpy(dtype=np.float64)
+    mu = estimates_df["mu_bb_per_hand"].to_numpy(dtype=np.float64)
+    sigma = np.sqrt(sigma2)
+
+    results = {
+        "stake_text": estimates_df["stake_text"].to_numpy(),
+        "mu": mu,
+        "sigma": sigma,
+        "sigma2": sigma2,
+    }
+
+    # Output column names per horizon, formatted once up front
+    colnames = {
+        n_hands: {
+            "ror": f"ror_{n_hands}h",
+            "mean": f"final_mean_{n_hands}h",
+            "std": f"final_std_{n_hands}h",
+            "p10": f"final_p10_{n_hands}h",
+            "p90": f"final_p90_{n_hands}h",
+            "dd": [
+                f"dd_{dd_threshold}bb_{n_hands}h"
+                for dd_threshold in config["drawdown_thresholds"]
+            ],
+        }
+        for n_hands in config["time_horizons"]
+    }
+    analytical = config.get("ror_method", "simulated") == "analytical"
 
-    for _, stake_row in estimates_df.iterrows():
-        stake = stake_row["stake_text"]
-        mu = stake_row["mu_bb_per_hand"]
-        sigma = np.sqrt(stake_row["sigma2_bb_per_hand"])
+    for n_hands, names in colnames.items():
+        col = np.searchsorted(horizons, n_hands)
 
-        stake_results = {
-            "stake_text": stake,
-            "mu": mu,
-            "sigma": sigma,
-            "sigma2": stake_row["sigma2_bb_per_hand"],
-        }
+        # Risk metrics and final bankroll statistics, one value per stake
+        final_bankrolls = levels[:, :, col] + bankroll
+        p10, p90 = np.percentile(final_bankrolls, [10, 90], axis=1)
 
-        # Run simulations for different time horizons
-        for n_hands in config["time_horizons"]:
-            # Simulate bankroll paths
-            paths = simulate_bankroll_paths(
-                mu=mu,
-                sigma=sigma,
-                initial_bankroll=config["current_bankroll_bb"],
-                n_hands=n_hands,
-                n_simulations=config["n_simulations"],
+        if analytical:
+            results[names["ror"]] = analytical_risk_of_ruin(
+                mu, sigma, bankroll, n_hands
             )
-
-            # Calculate risk metrics
-            ror = calculate_risk_of_ruin(paths, ruin_threshold=0)
-            drawdown_probs = calculate_drawdown_probabilities(
-                paths, config["drawdown_thresholds"]
+        else:
+            results[names["ror"]] = np.mean(
+                mins[:, :, col] <= -bankroll, axis=1
             )
+        results[names["mean"]] = np.mean(final_bankrolls, axis=1)
+        results[names["std"]] = np.std(final_bankrolls, axis=1)
+        results[names["p10"]] = p10
+        results[names["p90"]] = p90
 
-            # Final bankroll statistics
-            final_bankrolls = paths[:, -1]
+        # Drawdown probabilities, all thresholds at once
+        dd_probs = np.mean(
+            max_dds[:, :, col, None] >= thresholds, axis=1
+        )  # (n_stakes, n_thresholds)
+        results.update(zip(names["dd"], dd_probs.T))
 
-            stake_results[f"ror_{n_hands}h"] = ror
-            stake_results[f"final_mean_{n_hands}h"] = np.mean(final_bankrolls)
-            stake_results[f"final_std_{n_hands}h"] = np.std(final_bankrolls)
-            stake_results[f"final_p10_{n_hands}h"] = np.percentile(
-                final_bankrolls, 10
-            )
-            stake_results[f"final_p90_{n_hands}h"] = np.percentile(
-                final_bankrolls, 90
-            )
+    return pd.DataFrame(results)
 
-            # Store drawdown probabilities
-            for dd_threshold, dd_prob in drawdown_probs.items():
-                stake_results[f"dd_{dd_threshold}bb_{n_hands}h"] = dd_prob
 
-        simulation_results.append(stake_results)
+def run_stake_simulations(
+    estimates_df: pd.DataFrame, config: Dict, n_workers: Optional[int] = None
+) -> pd.DataFrame:
+    """
+    Run Monte Carlo simulations for all stake levels.
+
+    Simulates bankroll-independent path stats once and summarizes them
+    at config["current_bankroll_bb"]. With config["ror_method"] ==
+    "analytical" the ror columns come from analytical_risk_of_ruin
+    instead of the simulated paths.
+
+    Args:
+        estimates_df: DataFrame with mu/sigma estimates by stake
+        config: Simulation configuration dictionary
+        n_workers: Worker threads (default: one per CPU)
 
-    return pd.DataFrame(simulation_results)
+    Returns:
+        DataFrame with simulation results for each stake
+    """
+    path_stats = simulate_path_stats(
+        estimates_df,
+        config["n_simulations"],
+        config["time_horizons"],
+        n_workers,
+    )
+    return summarize_stake_simulations(estimates_df, path_stats, config)
 
 
 def calculate_bankroll_requirements(
@@ -172,33 +523,29 @@ def calculate_bankroll_requirements(
     Returns:
         DataFrame with bankroll recommendations
     """
-    requirements = []
-
-    for _, row in estimates_df.iterrows():
-        stake = row["stake_text"]
-        mu = row["mu_bb_per_hand"]
-        sigma = np.sqrt(row["sigma2_bb_per_hand"])
-
-        # Conservative bankroll estimate using Kelly-derived formula
-        if mu > 0 and sigma > 0:
-            # Approximate bankroll requirement for given RoR
-            z_score = abs(stats.norm.ppf(risk_tolerance))
-            required_bb = (z_score * sigma / mu) ** 2
+    stakes = estimates_df["stake_text"].to_numpy()
+    mus = estimates_df["mu_bb_per_hand"].to_numpy(dtype=np.float64)
+    sigmas = np.sqrt(
+        estimates_df["sigma2_bb_per_hand"].to_numpy(dtype=np.float64)
+    )
 
-            # Cap at reasonable limits
-            required_bb = min(required_bb, 10000)  # Max 10k BB
-            required_bb = max(required_bb, 1000)  # Min 1k BB
-        else:
-            required_bb = 5000  # Default for break-even or losing players
-
-        requirements.append(
-            {
-                "stake_text": stake,
-                "required_bankroll_bb": required_bb,
-                "required_buyins": required_bb / 100,  # Assuming 100BB buyins
-                "mu": mu,
-                "sigma": sigma,
-            }
+    # Conservative bankroll estimate using Kelly-derived formula: the
+    # approximate requirement for the given RoR, capped to 1k-10k BB, with
+    # 5k BB as the default for break-even or losing players
+    z_score = abs(stats.norm.ppf(risk_tolerance))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        required = np.where(
+            (mus > 0) & (sigmas > 0),
+            np.clip((z_score * sigmas / mus) ** 2, 1000, 10000),
+            5000.0,
         )
 
-    return pd.DataFrame(requirements)
+    return pd.DataFrame(
+        {
+            "stake_text": stakes,
+            "required_bankroll_bb": required,
+            "required_buyins": required / 100,  # Assuming 100BB buyins
+            "mu": mus,
+            "sigma": sigmas,
+        }
+    )
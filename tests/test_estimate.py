@@ -0,0 +1,31 @@
+"""
+Equivalence checks for the two estimation paths.
+"""
+
+import pandas as pd
+
+from src import (
+    Sessions,
+    create_sample_session_data,
+    enrich_session_data,
+    estimate_mu_sigma_by_stake,
+)
+from src.io_ops import set_session_dtypes
+
+
+def test_sessions_estimates_match_groupby():
+    """The bincount path over Sessions matches the DataFrame groupby."""
+    enriched = enrich_session_data(
+        set_session_dtypes(create_sample_session_data(500))
+    )
+
+    by_frame = estimate_mu_sigma_by_stake(enriched)
+    by_sessions = estimate_mu_sigma_by_stake(Sessions.from_dataframe(enriched))
+
+    # Enriched ratios are float32; the groupby sums them before widening
+    # while bincount accumulates in float64
+    pd.testing.assert_frame_equal(
+        by_frame.sort_values("stake_text", ignore_index=True),
+        by_sessions.sort_values("stake_text", ignore_index=True),
+        rtol=1e-5,
+    )
@@ -0,0 +1,102 @@
+"""
+Equivalence checks for the optimized simulation paths.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src import simulate
+from src.simulate import (
+    _make_rng,
+    _stream_path_stats,
+    calculate_risk_of_ruin,
+    run_stake_simulations,
+    simulate_bankroll_paths,
+)
+
+# Crosses _STREAM_BLOCK boundaries and ends off a block edge
+CHECKPOINTS = np.array([100, 1024, 1500, 3000])
+
+ESTIMATES = pd.DataFrame(
+    {
+        "stake_text": ["1-3", "2-5", "5-10"],
+        "mu_bb_per_hand": [0.05, 0.02, -0.01],
+        "sigma2_bb_per_hand": [64.0, 100.0, 81.0],
+    }
+)
+
+SIM_CONFIG = {
+    "n_simulations": 2500,
+    "time_horizons": [1000, 3000],
+    "current_bankroll_bb": 300,
+    "drawdown_thresholds": [200, 500],
+}
+
+
+def test_float32_paths_match_float64_ror():
+    """float32 bankroll paths give the float64 risk of ruin within 1e-4."""
+    mu, sigma, bankroll, n_hands, n_sims = 0.02, 10.0, 300.0, 1000, 4000
+
+    paths = simulate_bankroll_paths(
+        mu, sigma, bankroll, n_hands, n_sims, rng=_make_rng(7)
+    )
+    assert paths.dtype == np.float32
+
+    # Same float32 draws, accumulated in float64
+    steps = np.empty((n_sims, n_hands + 1), dtype=np.float32)
+    _make_rng(7).standard_normal(dtype=np.float32, out=steps)
+    reference = steps.astype(np.float64) * sigma + mu
+    reference[:, 0] = bankroll
+    np.cumsum(reference, axis=1, out=reference)
+
+    ror32 = calculate_risk_of_ruin(paths)
+    ror64 = calculate_risk_of_ruin(reference)
+    assert 0.0 < ror64 < 1.0
+    assert abs(ror32 - ror64) <= 1e-4
+
+
+@pytest.mark.skipif(not simulate.HAS_NUMBA, reason="numba not installed")
+def test_numba_kernel_matches_numpy_fallback(monkeypatch):
+    """The numba kernel and numpy fallback consume draws identically."""
+    args = (0.03, 9.0, 500.0, CHECKPOINTS, 200)
+    fast = _stream_path_stats(*args, rng=_make_rng(11))
+
+    monkeypatch.setattr(simulate, "HAS_NUMBA", False)
+    slow = _stream_path_stats(*args, rng=_make_rng(11))
+
+    for a, b in zip(fast, slow):
+        np.testing.assert_allclose(a, b, rtol=0, atol=1e-9)
+
+
+def test_path_stats_shift_with_bankroll():
+    """Minima and levels shift by the bankroll; drawdowns do not change."""
+    args = (0.01, 8.0)
+    mins0, dds0, levels0 = _stream_path_stats(
+        *args, 0.0, CHECKPOINTS, 300, _make_rng(3)
+    )
+    mins, dds, levels = _stream_path_stats(
+        *args, 750.0, CHECKPOINTS, 300, _make_rng(3)
+    )
+
+    np.testing.assert_allclose(mins, mins0 + 750.0, rtol=0, atol=1e-9)
+    np.testing.assert_allclose(levels, levels0 + 750.0, rtol=0, atol=1e-9)
+    np.testing.assert_allclose(dds, dds0, rtol=0, atol=1e-9)
+
+
+def test_ror_threshold_array_matches_scalar():
+    """A threshold sweep matches one scalar call per threshold."""
+    paths = simulate_bankroll_paths(0.02, 10.0, 0.0, 500, 2000)
+    thresholds = np.array([-50.0, -200.0, -400.0])
+
+    swept = calculate_risk_of_ruin(paths, thresholds)
+    expected = [calculate_risk_of_ruin(paths, t) for t in thresholds]
+    np.testing.assert_array_equal(swept, expected)
+
+
+def test_results_independent_of_worker_count():
+    """Per-block seeding makes results identical for any thread count."""
+    serial = run_stake_simulations(ESTIMATES, SIM_CONFIG, n_workers=1)
+    parallel = run_stake_simulations(ESTIMATES, SIM_CONFIG, n_workers=4)
+
+    pd.testing.assert_frame_equal(serial, parallel)